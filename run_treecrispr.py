@@ -23,17 +23,24 @@ python run_treecrispr.py -i sequences.fa -o results_crispra.csv --mode a
 """
 
 import argparse
+import itertools
 import logging
+import os
 import sys
 from pathlib import Path
 
+# Models are scored in parallel threads (see treecrispr.models); keep each
+# XGBoost predictor single-threaded so they do not oversubscribe the cores.
+# Must be set before xgboost / numpy are imported.
+os.environ.setdefault("OMP_NUM_THREADS", "1")
+
 # Ensure the package directory is importable when run directly.
 sys.path.insert(0, str(Path(__file__).parent))
 
 try:
     from treecrispr.config import MAX_SEQ_LEN, MODEL_DIR_A, MODEL_DIR_I
-    from treecrispr.io_utils import parse_fasta_file
-    from treecrispr.pipeline import run_full_pipeline
+    from treecrispr.io_utils import iter_fasta_file
+    from treecrispr.pipeline import iter_full_pipeline
 except ImportError as exc:
     print(f"CRITICAL ERROR: Could not import the 'treecrispr' package.\nDetails: {exc}")
     print("\n[Expected directory structure]")
@@ -123,43 +130,48 @@ def main() -> None:
         sys.exit(1)
 
     # ------------------------------------------------------------------
-    # Parse FASTA
+    # Open FASTA (records are streamed, not loaded up front)
     # ------------------------------------------------------------------
     log.info("Reading sequences from %s …", args.input)
     try:
-        records = parse_fasta_file(args.input, max_len=MAX_SEQ_LEN)
-    except (ValueError, FileNotFoundError) as exc:
+        records = iter_fasta_file(args.input, max_len=MAX_SEQ_LEN)
+        first = next(records, None)
+    except FileNotFoundError as exc:
         log.error("FASTA parsing error: %s", exc)
         sys.exit(1)
 
-    if not records:
-        log.warning("No valid sequences found in the input file.")
-        sys.exit(0)
-
-    log.info("Loaded %d sequence(s).  Running pipeline …", len(records))
+    if first is None:
+        log.error("FASTA parsing error: no valid FASTA records found in %s", args.input)
+        sys.exit(1)
 
     # ------------------------------------------------------------------
-    # Run pipeline
+    # Run pipeline, appending each scored chunk to the output CSV
     # ------------------------------------------------------------------
+    n_rows = 0
     try:
-        df_result = run_full_pipeline(records, log=log, model_dir=model_dir)
+        for chunk in iter_full_pipeline(
+            itertools.chain([first], records), log=log, model_dir=model_dir
+        ):
+            if n_rows == 0:
+                args.output.parent.mkdir(parents=True, exist_ok=True)
+            chunk.to_csv(args.output, mode="w" if n_rows == 0 else "a",
+                         header=n_rows == 0, index=False)
+            n_rows += len(chunk)
     except Exception as exc:
         log.error("Pipeline error: %s", exc, exc_info=True)
         sys.exit(1)
 
     # ------------------------------------------------------------------
-    # Save results
+    # Report
     # ------------------------------------------------------------------
-    if df_result.empty:
+    if n_rows == 0:
         log.warning(
             "Pipeline finished but produced no results. "
             "Check that your sequences contain valid NGG PAM sites."
         )
     else:
-        args.output.parent.mkdir(parents=True, exist_ok=True)
-        df_result.to_csv(args.output, index=False)
         log.info("Results saved to: %s", args.output)
-        log.info("Total candidates scored: %d", len(df_result))
+        log.info("Total candidates scored: %d", n_rows)
 
 
 if __name__ == "__main__":
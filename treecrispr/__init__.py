@@ -10,6 +10,7 @@ features_seq  : Sequence-derived feature extraction (one-hot, dinuc, thermodynam
 epi_seq       : BigWig interval extraction for epigenetic features.
 features_epi  : Coordinate-aware epigenetic feature assembly.
 pipeline      : End-to-end orchestration (scan → feature → score).
+batching      : Micro-batching of concurrent scoring requests for served use.
 models        : XGBoost model loading and robust prediction.
 plots         : Score visualisation and pairwise statistics.
 """
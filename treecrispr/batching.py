@@ -0,0 +1,262 @@
+"""
+treecrispr/batching.py — Micro-batching of concurrent scoring requests.
+
+When the pipeline is served (e.g. behind an HTTP or gRPC endpoint), each
+request typically carries a single FASTA record with a few dozen candidates.
+Scoring those one at a time pays the per-call model overhead for every
+request.  :class:`MicroBatcher` coalesces concurrent requests instead:
+
+1. Each request is scanned and featurised on its own, in a worker thread.
+2. Its feature matrix is put on an :class:`asyncio.Queue`.
+3. A single batch task takes up to ``max_batch_size`` candidates from the
+   queue, waiting at most ``max_wait_ms`` after the first one arrives, scores
+   them with one :func:`~treecrispr.models.score_with_models` call and hands
+   each request its own slice of the result.
+
+Models are loaded and BigWig files opened once for the batcher's lifetime.
+
+Example
+-------
+>>> async with MicroBatcher(MODEL_DIR_I) as batcher:      # doctest: +SKIP
+...     df = await batcher.submit("chr1:1000-1500", seq)
+
+Public API
+----------
+MicroBatcher(model_dir, log, max_batch_size, max_wait_ms)
+    ``await submit(fasta_id, seq)`` → pd.DataFrame, same columns as
+    :func:`~treecrispr.pipeline.run_full_pipeline` for that record.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import pandas as pd
+
+from .config import BATCH_MAX_SIZE, BATCH_MAX_WAIT_MS, MAX_SEQ_LEN
+from .epi_seq import close_bigwigs
+from .features_epi import open_bigwigs
+from .models import load_models_cached, score_with_models
+from .pipeline import CANDIDATE_COLS, build_candidates, compute_features_only
+
+logger = logging.getLogger(__name__)
+
+# Queue item: (candidates, features, future resolved with the scored frame).
+_Item = Tuple[pd.DataFrame, pd.DataFrame, "asyncio.Future[pd.DataFrame]"]
+
+
+class MicroBatcher:
+    """
+    Coalesce concurrent single-record requests into batched model calls.
+
+    Parameters
+    ----------
+    model_dir : Path, optional
+        Directory containing the model files (see
+        :func:`~treecrispr.models.load_models`).  If ``None``, requests are
+        featurised but not scored.
+    log : logging.Logger, optional
+        Logger for progress and warning messages.
+    max_batch_size : int
+        Maximum number of candidates scored in one call.  A single request
+        larger than this is scored on its own.
+    max_wait_ms : float
+        Maximum time to wait for more requests after the first one of a
+        batch arrives.
+    """
+
+    def __init__(
+        self,
+        model_dir: Optional[Path] = None,
+        log: Optional[logging.Logger] = None,
+        max_batch_size: int = BATCH_MAX_SIZE,
+        max_wait_ms: float = BATCH_MAX_WAIT_MS,
+    ) -> None:
+        self.model_dir = model_dir
+        self.log = log or logger
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000.0
+
+        self._models: Dict[str, Any] = {}
+        self._bigwigs: Dict[str, Any] = {}
+        # pyBigWig handles must not be queried from two threads at once.
+        self._bigwig_lock = threading.Lock()
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        # Item taken from the queue that did not fit in the previous batch.
+        self._carry: Optional[_Item] = None
+        # Items of the batch being collected or scored; kept on the instance
+        # so stop() can fail them if the batch task is cancelled mid-way.
+        self._batch: List[_Item] = []
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    async def start(self) -> None:
+        """Load models, open BigWig files and start the batch task."""
+        if self._task is not None:
+            return
+        if self.model_dir:
+            self._models = await asyncio.to_thread(
+                load_models_cached, self.model_dir, self.log
+            )
+        self._bigwigs = await asyncio.to_thread(open_bigwigs)
+        self._queue = asyncio.Queue()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """
+        Stop the batch task and close the BigWig files.
+
+        Requests that have not been scored yet (queued, being batched or
+        being scored) fail with :class:`RuntimeError`; later calls to
+        :meth:`submit` raise it directly.
+        """
+        # Clear _task first so that no submit() can enqueue after this point.
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+        pending = list(self._batch)
+        self._batch = []
+        if self._carry is not None:
+            pending.append(self._carry)
+            self._carry = None
+        while self._queue is not None and not self._queue.empty():
+            pending.append(self._queue.get_nowait())
+        for _, _, fut in pending:
+            if not fut.done():
+                fut.set_exception(RuntimeError("MicroBatcher stopped before the request was scored."))
+
+        # Wait for any featurisation still reading the tracks.
+        await asyncio.to_thread(self._close_bigwigs)
+
+    def _close_bigwigs(self) -> None:
+        with self._bigwig_lock:
+            close_bigwigs(self._bigwigs)
+            self._bigwigs = {}
+
+    async def __aenter__(self) -> "MicroBatcher":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc: Any) -> None:
+        await self.stop()
+
+    # ------------------------------------------------------------------
+    # Requests
+    # ------------------------------------------------------------------
+
+    async def submit(self, fasta_id: str, seq: str) -> pd.DataFrame:
+        """
+        Scan, featurise and score one FASTA record.
+
+        Returns
+        -------
+        pd.DataFrame with candidate columns followed by one score column per
+        model.  Empty (with :data:`~treecrispr.pipeline.CANDIDATE_COLS`) if
+        the record is too long or has no candidates.
+        """
+        if self._task is None:
+            raise RuntimeError("MicroBatcher is not running; call start() first.")
+
+        if len(seq) > MAX_SEQ_LEN:
+            self.log.warning("Skipping '%s': length %d exceeds MAX_SEQ_LEN=%d.", fasta_id, len(seq), MAX_SEQ_LEN)
+            return pd.DataFrame(columns=CANDIDATE_COLS)
+
+        cands, feats = await asyncio.to_thread(self._featurise, fasta_id, seq)
+        if cands.empty:
+            return pd.DataFrame(columns=CANDIDATE_COLS)
+
+        # stop() may have run while the record was being featurised.
+        if self._task is None:
+            raise RuntimeError("MicroBatcher stopped before the request was scored.")
+
+        fut: asyncio.Future[pd.DataFrame] = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((cands, feats, fut))
+        return await fut
+
+    def _featurise(self, fasta_id: str, seq: str) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """Build candidates and their feature matrix (runs in a worker thread)."""
+        cands = build_candidates(fasta_id, seq)
+        feats = compute_features_only(
+            cands, log=self.log, bigwigs=self._bigwigs, bigwig_lock=self._bigwig_lock
+        )
+        return cands, feats
+
+    # ------------------------------------------------------------------
+    # Batch loop
+    # ------------------------------------------------------------------
+
+    async def _next_batch(self) -> List[_Item]:
+        """
+        Wait for the first item, then collect more until full or timed out.
+
+        Items are collected into ``self._batch`` as they are taken off the
+        queue.
+        """
+        if self._carry is None:
+            self._carry = await self._queue.get()
+        first, self._carry = self._carry, None
+        batch = self._batch = [first]
+        n_rows = len(first[0])
+
+        deadline = asyncio.get_running_loop().time() + self.max_wait
+        while n_rows < self.max_batch_size:
+            timeout = deadline - asyncio.get_running_loop().time()
+            if timeout <= 0:
+                break
+            try:
+                item = await asyncio.wait_for(self._queue.get(), timeout)
+            except asyncio.TimeoutError:
+                break
+            if n_rows + len(item[0]) > self.max_batch_size:
+                self._carry = item
+                break
+            batch.append(item)
+            n_rows += len(item[0])
+
+        return batch
+
+    async def _run(self) -> None:
+        while True:
+            batch = await self._next_batch()
+            try:
+                merged = await asyncio.to_thread(self._score_batch, batch)
+            except Exception as exc:
+                for _, _, fut in batch:
+                    if not fut.done():
+                        fut.set_exception(exc)
+            else:
+                for (_, _, fut), df in zip(batch, merged):
+                    if not fut.done():
+                        fut.set_result(df)
+            self._batch = []
+
+    def _score_batch(self, batch: List[_Item]) -> List[pd.DataFrame]:
+        """Score every item of *batch* in one call and split the result."""
+        F = pd.concat([feats for _, feats, _ in batch], ignore_index=True)
+        if self._models:
+            scores = score_with_models(F, self._models, model_dir=self.model_dir, logger=self.log)
+        else:
+            scores = pd.DataFrame(index=F.index)
+
+        self.log.debug("Scored batch of %d request(s), %d candidates.", len(batch), len(F))
+
+        out: List[pd.DataFrame] = []
+        offset = 0
+        for cands, _, _ in batch:
+            n = len(cands)
+            part = scores.iloc[offset:offset + n].reset_index(drop=True)
+            out.append(pd.concat([cands.reset_index(drop=True), part], axis=1))
+            offset += n
+        return out
@@ -7,6 +7,19 @@ EPIG_EXTS   Comma-separated integer extensions (bp) for epigenetic window sizes.
             Default: "0,50,150,250,500,2500"
 EPIG_AGG    Aggregation method for BigWig values: "sum" or "mean".
             Default: "sum"
+TREECRISPR_TREELITE
+            Set to "1" to compile XGBoost models to native shared libraries
+            with Treelite / TL2cgen at load time.  Default: "0"
+TREECRISPR_USE_FIL
+            Set to "1" to score XGBoost models on the GPU with the RAPIDS
+            Forest Inference Library (cuML).  Takes precedence over
+            TREECRISPR_TREELITE.  Default: "0"
+TREECRISPR_BATCH_SIZE
+            Maximum number of candidates scored together by
+            :class:`~treecrispr.batching.MicroBatcher`.  Default: "1024"
+TREECRISPR_BATCH_WAIT_MS
+            Maximum time (ms) the micro-batcher waits to fill a batch.
+            Default: "10"
 """
 
 from __future__ import annotations
@@ -39,6 +52,18 @@ EPIGENETIC_EXTENSIONS: tuple[int, ...] = tuple(
 
 EPIG_AGGREGATION: str = os.getenv("EPIG_AGG", "sum").lower()
 
+# ---------------------------------------------------------------------------
+# Model backends
+# ---------------------------------------------------------------------------
+USE_TREELITE: bool = os.getenv("TREECRISPR_TREELITE", "0") == "1"
+USE_FIL: bool = os.getenv("TREECRISPR_USE_FIL", "0") == "1"
+
+# ---------------------------------------------------------------------------
+# Micro-batching (served use, see batching.py)
+# ---------------------------------------------------------------------------
+BATCH_MAX_SIZE: int = int(os.getenv("TREECRISPR_BATCH_SIZE", "1024"))
+BATCH_MAX_WAIT_MS: float = float(os.getenv("TREECRISPR_BATCH_WAIT_MS", "10"))
+
 # ---------------------------------------------------------------------------
 # Expected BigWig track names
 # NOTE: names must exactly match the stem of the .bw / .bigwig files placed
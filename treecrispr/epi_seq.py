@@ -7,15 +7,24 @@ that it can be mocked or replaced without touching the rest of the pipeline.
 
 Functions
 ---------
-single_interval_features(bw_paths, chrom, start0, end0, extensions, agg)
+open_bigwigs(bw_paths) / close_bigwigs(handles)
+    Open a set of BigWig files once so that the handles can be shared by
+    every candidate in a run.
+
+single_interval_features(bw_handles, chrom, start0, end0, extensions, agg)
     Compute one aggregate value per (BigWig track × window extension) pair
     for a single genomic interval.
+
+region_interval_features(bw_handles, chrom, starts0, ends0, extensions, agg)
+    Batched version for many nearby intervals on one chromosome: each track
+    is read once over the span covering all (extended) intervals and the
+    per-interval aggregates are taken from a prefix sum.
 """
 
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional
+from typing import Dict, Iterable, Mapping, Optional
 
 import numpy as np
 
@@ -93,8 +102,33 @@ def _agg_values(
 # Public API
 # ---------------------------------------------------------------------------
 
+def open_bigwigs(bw_paths: Mapping[str, Path]) -> Dict[str, "pyBigWig.pyBigWig"]:
+    """
+    Open every BigWig file in *bw_paths* (track label → path).
+
+    Files that cannot be opened are skipped.  Close the returned handles
+    with :func:`close_bigwigs`.
+    """
+    handles: Dict[str, "pyBigWig.pyBigWig"] = {}
+    for label, p in bw_paths.items():
+        try:
+            handles[label] = pyBigWig.open(str(p))
+        except Exception:
+            continue
+    return handles
+
+
+def close_bigwigs(handles: Mapping[str, "pyBigWig.pyBigWig"]) -> None:
+    """Close handles returned by :func:`open_bigwigs`, ignoring errors."""
+    for bw in handles.values():
+        try:
+            bw.close()
+        except Exception:
+            pass
+
+
 def single_interval_features(
-    bw_paths: List[Path],
+    bw_handles: Mapping[str, "pyBigWig.pyBigWig"],
     chrom: str,
     start0: int,
     end0: int,
@@ -110,8 +144,8 @@ def single_interval_features(
 
     Parameters
     ----------
-    bw_paths : list of Path
-        Paths to BigWig files.  Files that cannot be opened are skipped.
+    bw_handles : mapping of str → open BigWig
+        Track label → handle, as returned by :func:`open_bigwigs`.
     chrom : str
         Chromosome name (with or without ``"chr"`` prefix — both are tried).
     start0 : int
@@ -125,33 +159,89 @@ def single_interval_features(
 
     Returns
     -------
-    Dict mapping ``"{track_stem}_{ext}"`` → float value.  All columns are
-    pre-declared to ``0.0`` so the shape is stable even when a track fails.
+    Dict mapping ``"{track_label}_{ext}"`` → float value.
     """
     ext_list = list(extensions)
     out: Dict[str, float] = {}
 
-    # Pre-declare all columns to 0.0 for shape stability.
-    for p in bw_paths:
-        stem = p.stem
+    for label, bw in bw_handles.items():
         for ext in ext_list:
-            out[f"{stem}_{int(ext)}"] = 0.0
+            s = start0 - int(ext)
+            e = end0 + int(ext)
+            out[f"{label}_{int(ext)}"] = _agg_values(bw, chrom, s, e, agg=agg)
+
+    return out
+
+
+def region_interval_features(
+    bw_handles: Mapping[str, "pyBigWig.pyBigWig"],
+    chrom: str,
+    starts0: np.ndarray,
+    ends0: np.ndarray,
+    extensions: Iterable[int],
+    agg: str = "sum",
+) -> Dict[str, np.ndarray]:
+    """
+    Compute epigenetic features for many intervals on the same chromosome.
+
+    Equivalent to calling :func:`single_interval_features` once per
+    interval, but each track is queried only once, over the span covering
+    every extended interval.  Intended for clustered intervals such as all
+    candidates of one FASTA record.
 
-    for p in bw_paths:
-        stem = p.stem
+    Parameters
+    ----------
+    bw_handles : mapping of str → open BigWig
+        Track label → handle, as returned by :func:`open_bigwigs`.
+    chrom : str
+        Chromosome name (with or without ``"chr"`` prefix — both are tried).
+    starts0, ends0 : array of int
+        0-based half-open core intervals.
+    extensions : iterable of int
+        Window extensions in base pairs.
+    agg : str
+        Aggregation method: ``"sum"`` (default) or ``"mean"``.
+
+    Returns
+    -------
+    Dict mapping ``"{track_label}_{ext}"`` → float array aligned with
+    *starts0*.  Tracks or intervals without data are ``0.0``.
+    """
+    starts0 = np.asarray(starts0, dtype=np.int64)
+    ends0 = np.asarray(ends0, dtype=np.int64)
+    ext_list = [int(ext) for ext in extensions]
+    out: Dict[str, np.ndarray] = {
+        f"{label}_{ext}": np.zeros(len(starts0)) for label in bw_handles for ext in ext_list
+    }
+    if len(starts0) == 0 or not ext_list:
+        return out
+
+    for label, bw in bw_handles.items():
+        name = _resolve_chrom_name(bw, chrom)
+        if name is None:
+            continue
         try:
-            bw = pyBigWig.open(str(p))
+            clen = int(bw.chroms()[name])
         except Exception:
             continue
+
+        lo = max(0, int(starts0.min()) - max(ext_list))
+        hi = min(clen, int(ends0.max()) + max(ext_list))
+        if hi <= lo:
+            continue
         try:
-            for ext in ext_list:
-                s = start0 - int(ext)
-                e = end0 + int(ext)
-                out[f"{stem}_{int(ext)}"] = _agg_values(bw, chrom, s, e, agg=agg)
-        finally:
-            try:
-                bw.close()
-            except Exception:
-                pass
+            arr = np.array(bw.values(name, lo, hi, numpy=True), dtype=float)
+        except Exception:
+            continue
+        arr[np.isnan(arr)] = 0.0
+        csum = np.concatenate([[0.0], np.cumsum(arr)])
+
+        for ext in ext_list:
+            s = np.clip(starts0 - ext, lo, hi)
+            e = np.clip(ends0 + ext, lo, hi)
+            total = np.where(e > s, csum[e - lo] - csum[s - lo], 0.0)
+            if agg == "mean":
+                total = total / np.maximum(1, e - s)
+            out[f"{label}_{ext}"] = total
 
     return out
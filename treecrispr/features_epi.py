@@ -8,8 +8,13 @@ For each guide-RNA candidate, this module:
 2. Locates BigWig files in :data:`~treecrispr.config.BIGWIG_DIR` by matching
    them against the expected track names in
    :data:`~treecrispr.config.EXPECTED_BIGWIGS`.
-3. Calls :func:`~treecrispr.epi_seq.single_interval_features` to extract
-   per-track signal at multiple window extensions.
+3. Calls :func:`~treecrispr.epi_seq.region_interval_features` (or
+   :func:`~treecrispr.epi_seq.single_interval_features` for a single row) to
+   extract per-track signal at multiple window extensions.
+
+BigWig files are opened once by :func:`open_bigwigs` and the handles are
+passed to the feature functions, so a run pays the open/index cost once per
+track rather than once per candidate.
 
 If coordinates cannot be parsed, or BigWig files are absent, a zero-filled
 feature dict is returned so that the scoring models can still run on sequence
@@ -17,8 +22,14 @@ features alone.
 
 Public API
 ----------
+open_bigwigs()
+    Open every BigWig track found in BIGWIG_DIR (close with
+    :func:`~treecrispr.epi_seq.close_bigwigs`).
 epigenetic_features(row, logger)
-    Main entry point called by the pipeline for every candidate row.
+    Feature dict for a single candidate row.
+epigenetic_feature_matrix(df, logger)
+    Feature matrix for a whole candidate DataFrame; columns follow
+    :data:`EPI_FEATURE_NAMES`.  This is what the pipeline calls.
 """
 
 from __future__ import annotations
@@ -26,8 +37,9 @@ from __future__ import annotations
 import functools
 import re
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Mapping, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 
 from .config import (
@@ -36,7 +48,12 @@ from .config import (
     EPIG_AGGREGATION,
     EXPECTED_BIGWIGS,
 )
-from .epi_seq import single_interval_features
+from .epi_seq import (
+    close_bigwigs,
+    open_bigwigs as _open_bigwig_paths,
+    region_interval_features,
+    single_interval_features,
+)
 
 # ---------------------------------------------------------------------------
 # Coordinate parsing
@@ -48,6 +65,35 @@ _COORD_RE = re.compile(
 )
 
 
+def _split_plain_region(id_str: str) -> Optional[Tuple[str, str, str]]:
+    """
+    Split a plain ``chr<name>:<start>-<end>`` ID without using the regex.
+
+    Returns ``(chrom, start, end)`` as strings, or ``None`` if *id_str* is
+    not exactly in that form (the caller then falls back to
+    :data:`_COORD_RE`).
+    """
+    head, sep, tail = id_str.partition(":")
+    if not sep:
+        return None
+    start, sep, end = tail.partition("-")
+    if not sep:
+        return None
+    if not (
+        len(head) > 3
+        and head[:3].lower() == "chr"
+        and head.isascii()
+        and head[3:].replace("_", "").isalnum()
+    ):
+        return None
+    for num in (start, end):
+        digits = num.replace(",", "")
+        if not (digits and digits.isascii() and digits.isdigit()):
+            return None
+    return head, start, end
+
+
+@functools.lru_cache(maxsize=4096)
 def _parse_id_region(id_str: str) -> Optional[Tuple[str, int, int]]:
     """
     Extract ``(chrom, start_0based, end_0based)`` from a FASTA record ID.
@@ -55,15 +101,22 @@ def _parse_id_region(id_str: str) -> Optional[Tuple[str, int, int]]:
     Coordinates in the ID are assumed to be 1-based closed; this function
     converts the start to 0-based half-open (BED convention).  Returns
     ``None`` if no recognisable coordinate pattern is found.
+
+    IDs of the plain form ``chrN:start-end`` are split directly; anything
+    else goes through :data:`_COORD_RE`.  Results are memoised, since every
+    candidate from a FASTA record shares the same ID.
     """
-    m = _COORD_RE.search(id_str)
-    if not m:
-        return None
-    chrom = m.group(1)
+    parts = _split_plain_region(id_str)
+    if parts is None:
+        m = _COORD_RE.search(id_str)
+        if not m:
+            return None
+        parts = m.group(1), m.group(2), m.group(3)
+    chrom, start_s, end_s = parts
     if not chrom.lower().startswith("chr"):
         chrom = "chr" + chrom
-    start = int(m.group(2).replace(",", ""))
-    end   = int(m.group(3).replace(",", ""))
+    start = int(start_s.replace(",", ""))
+    end   = int(end_s.replace(",", ""))
     if start > 0:
         start -= 1  # 1-based → 0-based
     return chrom.lower(), start, end
@@ -104,6 +157,17 @@ def _map_files_to_expected_names() -> Dict[str, Path]:
     return mapping
 
 
+def open_bigwigs() -> Dict[str, Any]:
+    """
+    Open every track found by :func:`_map_files_to_expected_names`.
+
+    Returns a dict of expected track name → open BigWig handle.  Pass it as
+    *bigwigs* to the feature functions and close it with
+    :func:`~treecrispr.epi_seq.close_bigwigs` when done.
+    """
+    return _open_bigwig_paths(_map_files_to_expected_names())
+
+
 # ---------------------------------------------------------------------------
 # Zero-valued feature template (stable column layout)
 # ---------------------------------------------------------------------------
@@ -122,22 +186,36 @@ def _predeclare_zero_feats() -> Dict[str, float]:
     }
 
 
+# Built once at import; epigenetic_features() starts from a shallow copy.
+_ZERO_FEATS_TEMPLATE: Dict[str, float] = _predeclare_zero_feats()
+
+# Column layout produced by :func:`epigenetic_features`.
+EPI_FEATURE_NAMES: list[str] = list(_ZERO_FEATS_TEMPLATE)
+
+
 # ---------------------------------------------------------------------------
 # Public API
 # ---------------------------------------------------------------------------
 
-def epigenetic_features(row: pd.Series, logger=None) -> Dict[str, float]:
+def epigenetic_features(
+    row: Mapping,
+    logger=None,
+    bigwigs: Optional[Mapping[str, Any]] = None,
+) -> Dict[str, float]:
     """
     Extract epigenetic features for a single guide-RNA candidate.
 
     Parameters
     ----------
-    row : pd.Series
+    row : pd.Series or dict
         A row from the candidates DataFrame.  Must contain at least the
-        columns ``"ID"``, ``"Start"``, and ``"End"``.
+        keys ``"ID"``, ``"Start"``, and ``"End"``.
     logger : logging.Logger, optional
         If provided, warnings about missing coordinates or BigWig errors
         are emitted at ``WARNING`` level.
+    bigwigs : dict, optional
+        Open handles from :func:`open_bigwigs`.  If omitted, the tracks are
+        opened and closed within this call.
 
     Returns
     -------
@@ -145,7 +223,7 @@ def epigenetic_features(row: pd.Series, logger=None) -> Dict[str, float]:
     always present (defaulting to 0.0 on failure).
     """
     # Always return the full expected column layout.
-    feats = _predeclare_zero_feats()
+    feats = _ZERO_FEATS_TEMPLATE.copy()
 
     # Step 1: parse genomic coordinates from the FASTA record ID.
     parsed = _parse_id_region(str(row.get("ID", "")))
@@ -163,30 +241,22 @@ def epigenetic_features(row: pd.Series, logger=None) -> Dict[str, float]:
     abs_start = abs_start_input + off_start
     abs_end   = abs_start_input + off_end
 
-    # Step 2: find BigWig files and overwrite the zero defaults.
-    file_map = _map_files_to_expected_names()
-    if not file_map:
-        return feats
-
+    # Step 2: query the BigWig tracks and overwrite the zero defaults.
+    handles = bigwigs if bigwigs is not None else open_bigwigs()
     try:
-        found_paths = list(file_map.values())
+        if not handles:
+            return feats
         raw_vals = single_interval_features(
-            bw_paths=found_paths,
+            bw_handles=handles,
             chrom=chrom,
             start0=abs_start,
             end0=abs_end,
             extensions=EPIGENETIC_EXTENSIONS,
             agg=EPIG_AGGREGATION,
         )
-
-        # Map raw keys ("{file_stem}_{ext}") → model keys ("{expected_name}_{ext}").
-        for expected_name, file_path in file_map.items():
-            file_stem = file_path.stem
-            for ext in EPIGENETIC_EXTENSIONS:
-                raw_key   = f"{file_stem}_{int(ext)}"
-                model_key = f"{expected_name}_{int(ext)}"
-                if raw_key in raw_vals:
-                    feats[model_key] = float(raw_vals[raw_key])
+        for key, val in raw_vals.items():
+            if key in feats:
+                feats[key] = float(val)
 
     except Exception as exc:
         if logger:
@@ -195,5 +265,100 @@ def epigenetic_features(row: pd.Series, logger=None) -> Dict[str, float]:
                 row.get("ID"),
                 exc,
             )
+    finally:
+        if bigwigs is None:
+            close_bigwigs(handles)
 
     return feats
+
+
+def epigenetic_feature_matrix(
+    df: pd.DataFrame,
+    logger=None,
+    bigwigs: Optional[Mapping[str, Any]] = None,
+    out: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """
+    Extract epigenetic features for every row of a candidate DataFrame.
+
+    Rows are grouped by FASTA record (``ID``): the record's coordinates are
+    parsed once and all of its candidates are queried together with
+    :func:`~treecrispr.epi_seq.region_interval_features`, i.e. one read per
+    track per record.  Records are visited in genomic order (chromosome, then
+    region start) rather than input order, so consecutive reads hit
+    neighbouring BigWig blocks.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        Candidates DataFrame with ``"ID"``, ``"Start"`` and ``"End"`` columns.
+    logger : logging.Logger, optional
+        If provided, BigWig errors are emitted at ``WARNING`` level.
+    bigwigs : dict, optional
+        Open handles from :func:`open_bigwigs`.  If omitted, the tracks are
+        opened and closed within this call.
+    out : np.ndarray, optional
+        Preallocated ``(len(df), len(EPI_FEATURE_NAMES))`` float array (or a
+        column slice of a wider buffer) to write into.
+
+    Returns
+    -------
+    ``(len(df), len(EPI_FEATURE_NAMES))`` float array whose columns follow
+    :data:`EPI_FEATURE_NAMES` (*out* itself if given).  Rows without
+    parseable coordinates are 0.0.
+    """
+    if out is None:
+        mat = np.zeros((len(df), len(EPI_FEATURE_NAMES)), dtype=float)
+    else:
+        mat = out
+        mat[:] = 0.0
+    if df.empty:
+        return mat
+
+    handles = bigwigs if bigwigs is not None else open_bigwigs()
+    try:
+        if not handles:
+            return mat
+
+        col_of = {name: j for j, name in enumerate(EPI_FEATURE_NAMES)}
+        starts = pd.to_numeric(df["Start"], errors="coerce").to_numpy(dtype=float)
+        ends = pd.to_numeric(df["End"], errors="coerce").to_numpy(dtype=float)
+        ok = ~(np.isnan(starts) | np.isnan(ends))
+
+        regions: List[Tuple[str, int, Any, np.ndarray]] = []
+        for id_val, idx in df.groupby("ID", sort=False, observed=True).indices.items():
+            parsed = _parse_id_region(str(id_val))
+            if not parsed:
+                continue
+            idx = idx[ok[idx]]
+            if len(idx) == 0:
+                continue
+            regions.append((parsed[0], parsed[1], id_val, idx))
+        regions.sort(key=lambda r: (r[0], r[1]))
+
+        for chrom, abs_start_input, id_val, idx in regions:
+
+            try:
+                raw_vals = region_interval_features(
+                    bw_handles=handles,
+                    chrom=chrom,
+                    starts0=abs_start_input + starts[idx].astype(np.int64),
+                    ends0=abs_start_input + ends[idx].astype(np.int64),
+                    extensions=EPIGENETIC_EXTENSIONS,
+                    agg=EPIG_AGGREGATION,
+                )
+            except Exception as exc:
+                if logger:
+                    logger.warning(
+                        "Epigenetic feature extraction failed for '%s': %s", id_val, exc
+                    )
+                continue
+
+            for key, vals in raw_vals.items():
+                if key in col_of:
+                    mat[idx, col_of[key]] = vals
+    finally:
+        if bigwigs is None:
+            close_bigwigs(handles)
+
+    return mat
@@ -9,6 +9,10 @@ parse_fasta_text(text, max_len)
 parse_fasta_file(path, max_len)
     Read a FASTA file from disk and delegate to :func:`parse_fasta_text`.
 
+iter_fasta_file(path, max_len)
+    Stream ``(id, sequence)`` tuples from a FASTA file one record at a time,
+    without reading the whole file into memory.
+
 Notes
 -----
 - Only ACGT characters are retained; any other character triggers a warning
@@ -21,43 +25,28 @@ from __future__ import annotations
 import re
 import sys
 from pathlib import Path
-from typing import List, Tuple
+from typing import Iterable, Iterator, List, Tuple
 
 # Regex to detect non-ACGT characters in a (already upper-cased) sequence.
 _INVALID_RE = re.compile(r"[^ACGT]")
 
 
-def parse_fasta_text(
-    text: str,
+def _iter_fasta_records(
+    lines: Iterable[str],
     max_len: int,
-) -> List[Tuple[str, str]]:
+) -> Iterator[Tuple[str, str]]:
     """
-    Parse a FASTA-formatted string.
-
-    Parameters
-    ----------
-    text : str
-        Raw FASTA content (may contain multiple records).
-    max_len : int
-        Maximum allowed sequence length.  Records longer than this are
-        silently skipped (a warning is printed to *stderr*).
+    Yield ``(record_id, sequence)`` tuples from an iterable of FASTA lines.
 
-    Returns
-    -------
-    List of ``(record_id, sequence)`` tuples, one per valid FASTA record.
-
-    Raises
-    ------
-    ValueError
-        If *text* contains no recognisable FASTA records.
+    Shared by the in-memory and streaming parsers; see
+    :func:`parse_fasta_text` for the validation rules.
     """
-    records: List[Tuple[str, str]] = []
     current_id: str | None = None
     seq_parts: List[str] = []
 
-    def _commit() -> None:
+    def _finish() -> Tuple[str, str] | None:
         if current_id is None:
-            return
+            return None
         seq = "".join(seq_parts).upper()
         if len(seq) > max_len:
             print(
@@ -65,27 +54,58 @@ def parse_fasta_text(
                 f"length {len(seq)} exceeds max_len={max_len}.",
                 file=sys.stderr,
             )
-            return
+            return None
         if _INVALID_RE.search(seq):
             print(
                 f"[io_utils] WARNING: '{current_id}' contains non-ACGT characters; "
                 "they will be ignored during feature extraction.",
                 file=sys.stderr,
             )
-        records.append((current_id, seq))
+        return current_id, seq
 
-    for line in text.splitlines():
+    for line in lines:
         line = line.strip()
         if not line:
             continue
         if line.startswith(">"):
-            _commit()
+            record = _finish()
+            if record is not None:
+                yield record
             current_id = line[1:].split()[0]
             seq_parts = []
         else:
             seq_parts.append(line)
 
-    _commit()  # flush last record
+    record = _finish()  # flush last record
+    if record is not None:
+        yield record
+
+
+def parse_fasta_text(
+    text: str,
+    max_len: int,
+) -> List[Tuple[str, str]]:
+    """
+    Parse a FASTA-formatted string.
+
+    Parameters
+    ----------
+    text : str
+        Raw FASTA content (may contain multiple records).
+    max_len : int
+        Maximum allowed sequence length.  Records longer than this are
+        silently skipped (a warning is printed to *stderr*).
+
+    Returns
+    -------
+    List of ``(record_id, sequence)`` tuples, one per valid FASTA record.
+
+    Raises
+    ------
+    ValueError
+        If *text* contains no recognisable FASTA records.
+    """
+    records = list(_iter_fasta_records(text.splitlines(), max_len))
 
     if not records:
         raise ValueError("No valid FASTA records found in the provided text.")
@@ -119,3 +139,27 @@ def parse_fasta_file(path: Path, max_len: int) -> List[Tuple[str, str]]:
     if not path.exists():
         raise FileNotFoundError(f"FASTA file not found: {path}")
     return parse_fasta_text(path.read_text(encoding="utf-8", errors="replace"), max_len)
+
+
+def iter_fasta_file(path: Path, max_len: int) -> Iterator[Tuple[str, str]]:
+    """
+    Stream records from the FASTA file at *path*.
+
+    Same validation as :func:`parse_fasta_file`, but the file is read line
+    by line and records are yielded as soon as they are complete, so memory
+    use does not grow with file size.  An empty file simply yields nothing.
+
+    Raises
+    ------
+    FileNotFoundError
+        If *path* does not exist (raised immediately, not on first iteration).
+    """
+    path = Path(path)
+    if not path.exists():
+        raise FileNotFoundError(f"FASTA file not found: {path}")
+
+    def _stream() -> Iterator[Tuple[str, str]]:
+        with path.open(encoding="utf-8", errors="replace") as fh:
+            yield from _iter_fasta_records(fh, max_len)
+
+    return _stream()
@@ -8,9 +8,28 @@ All ``.pkl`` and ``.joblib`` files in a given directory are loaded with
 (``_xgb_clf``, ``_xgb``, ``_clf``) so that the output column names in the
 results CSV are human-readable.
 
+XGBoost's native binary format (``.ubj``) loads much faster than a pickle.
+:func:`export_native_models` writes a ``.ubj`` next to each pickled XGBoost
+model; from then on :func:`load_models` loads the ``.ubj`` as an
+``xgboost.Booster`` instead of unpickling.  :func:`load_models_cached` keeps
+loaded models in memory per directory (invalidated when any model file in it
+changes), so repeated pipeline runs in one process do not reload them.
+
+When ``TREECRISPR_TREELITE=1`` (see :mod:`config`) and ``treelite`` /
+``tl2cgen`` are installed, each XGBoost model is compiled to a native shared
+library and replaced by a ``tl2cgen.Predictor``.  The library is cached next
+to the model file, keyed by the file's mtime and content hash, so the compile
+only runs once per model version.  Compiled models take positional input, so
+they never need the column-renaming fallback below.
+
+When ``TREECRISPR_USE_FIL=1`` and RAPIDS cuML is installed, XGBoost models are
+instead loaded into the GPU Forest Inference Library (FIL) and scored there;
+the shared feature array is copied to the device once per scoring call and
+shared by every FIL model.
+
 Scoring
 -------
-:func:`score_with_models` uses a three-attempt fallback strategy to handle
+:func:`score_with_models` supports three calling conventions to handle
 column-name mismatches between the Python feature extraction pipeline and
 models that were originally trained in R:
 
@@ -19,26 +38,80 @@ models that were originally trained in R:
    ``di{i}_{NN}`` → ``{NN}{i+1}`` via :func:`fix_column_names_for_xgboost`.
 3. **Strip names** — convert to a NumPy array so XGBoost cannot check names.
 
+The numeric feature matrix is converted to a single contiguous ``float32``
+array once per call and shared by every model.  XGBoost models (scikit-learn
+wrappers and bare boosters alike) are scored on that array with
+``Booster.inplace_predict``, which skips ``DMatrix`` construction and
+feature validation (column order is positional, exactly as in attempt 3), so
+they never need a calling convention.  For other models the convention is
+chosen once, by probing with a single all-zero row (at load time for the
+standard feature layout, otherwise on first use), and cached in
+:data:`_NAME_MODE`; scoring then dispatches on it directly.
+
 Public API
 ----------
 fix_column_names_for_xgboost(df)         → pd.DataFrame
 load_models(model_dir, logger)            → Dict[str, Any]
+load_models_cached(model_dir, logger)     → Dict[str, Any]
+export_native_models(model_dir, logger)   → List[Path]
 score_with_models(features_df, models, …) → pd.DataFrame
 pretty_model_name(raw_name)               → str
 """
 
 from __future__ import annotations
 
+import functools
+import hashlib
+import json
 import logging
+import os
+import tempfile
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import joblib
 import numpy as np
 import pandas as pd
 
+try:
+    import xgboost as xgb
+    _HAS_XGBOOST = True
+except ImportError:
+    _HAS_XGBOOST = False
+
+try:
+    import tl2cgen
+    import treelite
+    _HAS_TREELITE = True
+except ImportError:
+    _HAS_TREELITE = False
+
+try:
+    import cupy
+    from cuml import ForestInference
+    _HAS_FIL = True
+except ImportError:
+    _HAS_FIL = False
+
+from .config import USE_FIL, USE_TREELITE
+from .features_epi import EPI_FEATURE_NAMES
+from .features_seq import SEQ_FEATURE_NAMES
+
 logger = logging.getLogger(__name__)
 
+# Calling convention chosen for each non-XGBoost model: "direct",
+# "renamed", "stripped", or ``None`` if the model accepts none of them.
+# Weakly keyed, so entries go away with their models.
+_NAME_MODE: "weakref.WeakKeyDictionary[Any, Optional[str]]" = weakref.WeakKeyDictionary()
+_NAME_MODE_LOCK = threading.Lock()
+
+# Column layout of the feature matrix built by the pipeline, used to probe
+# calling conventions at load time.
+_FEATURE_COLUMNS: List[str] = SEQ_FEATURE_NAMES + EPI_FEATURE_NAMES
+
 
 # ---------------------------------------------------------------------------
 # Name utilities
@@ -105,10 +178,190 @@ def fix_column_names_for_xgboost(df: pd.DataFrame) -> pd.DataFrame:
     return df.rename(columns=rename_map) if rename_map else df
 
 
+# ---------------------------------------------------------------------------
+# Compiled and GPU backends (Treelite, FIL)
+# ---------------------------------------------------------------------------
+
+def _is_xgb_sklearn(model: Any) -> bool:
+    """Return ``True`` if *model* is an XGBoost scikit-learn wrapper."""
+    return _HAS_XGBOOST and isinstance(model, xgb.XGBModel)
+
+
+def _is_xgb_booster(model: Any) -> bool:
+    """Return ``True`` if *model* is a bare ``xgboost.Booster``."""
+    return _HAS_XGBOOST and isinstance(model, xgb.Booster)
+
+
+def _as_booster(model: Any) -> Any:
+    """Return the underlying ``xgboost.Booster`` of an XGBoost model."""
+    return model if _is_xgb_booster(model) else model.get_booster()
+
+
+def _trimmed_booster(model: Any) -> Any:
+    """
+    Return the ``xgboost.Booster`` of *model*, cut to ``best_iteration + 1``
+    rounds if it was trained with early stopping (as ``predict_proba`` does).
+    """
+    booster = _as_booster(model)
+    best = booster.attr("best_iteration")
+    return booster[: int(best) + 1] if best is not None else booster
+
+
+def _missing_value(model: Any) -> float:
+    """
+    Return the value an XGBoost model treats as missing (NaN by default).
+
+    Scikit-learn wrappers carry it as ``model.missing``; bare boosters
+    exported by :func:`export_native_models` carry it as the ``missing``
+    attribute.
+    """
+    if _is_xgb_booster(model):
+        missing = model.attr("missing")
+    else:
+        missing = getattr(model, "missing", None)
+    return np.nan if missing is None else float(missing)
+
+
+def _compile_treelite(model: Any, path: Path, logger: logging.Logger) -> Any:
+    """
+    Compile an XGBoost model to a shared library and return its predictor.
+
+    Only the trees up to ``best_iteration`` are compiled (see
+    :func:`_trimmed_booster`).  The library is written next to *path* as
+    ``{stem}.{mtime}_{sha256[:16]}_r{rounds}.so`` and reused on subsequent
+    loads.  Returns *model* unchanged if compilation or loading fails, or if
+    the model uses a non-NaN ``missing`` value (compiled predictors only
+    treat NaN as missing).
+    """
+    if not np.isnan(_missing_value(model)):
+        logger.info("Not compiling %s: missing=%s is not NaN.", path.name, _missing_value(model))
+        return model
+    try:
+        booster = _trimmed_booster(model)
+        digest = hashlib.sha256(path.read_bytes()).hexdigest()[:16]
+        libpath = path.with_name(
+            f"{path.stem}.{int(path.stat().st_mtime)}_{digest}"
+            f"_r{booster.num_boosted_rounds()}.so"
+        )
+        if not libpath.exists():
+            logger.info("Compiling %s with Treelite …", path.name)
+            tl_model = treelite.frontend.from_xgboost(booster)
+            tl2cgen.export_lib(
+                tl_model,
+                toolchain="gcc",
+                libpath=str(libpath),
+                params={"parallel_comp": min(32, os.cpu_count() or 1)},
+            )
+        return tl2cgen.Predictor(str(libpath))
+    except Exception as exc:
+        logger.warning("Treelite compilation failed for '%s': %s", path.name, exc)
+        return model
+
+
+class _FILModel:
+    """A cuML ``ForestInference`` model plus whether it outputs class scores."""
+
+    def __init__(self, fil: Any, output_class: bool) -> None:
+        self.fil = fil
+        self.output_class = output_class
+
+
+def _is_classifier(model: Any) -> bool:
+    """Return ``True`` if an XGBoost model has a classification objective."""
+    if _is_xgb_sklearn(model):
+        return isinstance(model, xgb.XGBClassifier)
+    objective = json.loads(model.save_config())["learner"]["objective"]["name"]
+    return objective.startswith(("binary:", "multi:"))
+
+
+def _load_fil(model: Any, path: Path, logger: logging.Logger) -> Any:
+    """
+    Load an XGBoost model into cuML FIL and return it as a :class:`_FILModel`.
+
+    Only the trees up to ``best_iteration`` are exported (see
+    :func:`_trimmed_booster`).  Returns *model* unchanged if the conversion
+    fails, or if the model uses a non-NaN ``missing`` value (FIL only treats
+    NaN as missing).
+    """
+    if not np.isnan(_missing_value(model)):
+        logger.info("Not loading %s into FIL: missing=%s is not NaN.", path.name, _missing_value(model))
+        return model
+    try:
+        output_class = _is_classifier(model)
+        with tempfile.TemporaryDirectory() as tmp:
+            json_path = str(Path(tmp) / f"{path.stem}.json")
+            _trimmed_booster(model).save_model(json_path)
+            fil = ForestInference.load(
+                json_path, model_type="xgboost_json", output_class=output_class
+            )
+        logger.info("Loaded %s into FIL (GPU).", path.name)
+        return _FILModel(fil, output_class)
+    except Exception as exc:
+        logger.warning("FIL conversion failed for '%s': %s", path.name, exc)
+        return model
+
+
+def _predict_fil(model: _FILModel, X_dev: Any) -> np.ndarray:
+    """
+    Score the device array *X_dev* on the GPU with FIL, matching
+    :func:`_predict_safe` output.
+    """
+    if not model.output_class:
+        return cupy.asnumpy(model.fil.predict(X_dev)).ravel()
+    proba = cupy.asnumpy(model.fil.predict_proba(X_dev))
+    if proba.ndim == 2 and proba.shape[1] == 2:
+        return proba[:, 1]
+    return proba.max(axis=1)
+
+
+def _predict_treelite(predictor: Any, X: np.ndarray) -> np.ndarray:
+    """Score *X* with a compiled predictor, matching :func:`_predict_safe` output."""
+    out = predictor.predict(tl2cgen.DMatrix(X)).reshape(X.shape[0], -1)
+    if out.shape[1] == 1:
+        return out[:, 0]
+    if out.shape[1] == 2:
+        return out[:, 1]
+    return out.max(axis=1)
+
+
 # ---------------------------------------------------------------------------
 # Model loading
 # ---------------------------------------------------------------------------
 
+def _model_files(model_dir: Path) -> List[Tuple[Path, Optional[Path]]]:
+    """
+    List model files in *model_dir* as ``(path to load, sibling)`` pairs.
+
+    A native ``.ubj`` is preferred over a pickle with the same stem only if
+    it is at least as new as the pickle; otherwise the pickle is loaded (the
+    ``.ubj`` is stale).  *sibling* is the other file of such a pair, or
+    ``None``.
+    """
+    pickles = sorted(model_dir.glob("*.pkl")) + sorted(model_dir.glob("*.joblib"))
+    if not _HAS_XGBOOST:
+        return [(p, None) for p in pickles]
+
+    native = {p.stem: p for p in sorted(model_dir.glob("*.ubj"))}
+    files: List[Tuple[Path, Optional[Path]]] = []
+    for p in pickles:
+        ubj = native.pop(p.stem, None)
+        if ubj is None:
+            files.append((p, None))
+        elif ubj.stat().st_mtime >= p.stat().st_mtime:
+            files.append((ubj, p))
+        else:
+            files.append((p, ubj))
+    return files + [(p, None) for p in native.values()]
+
+
+def _load_one(p: Path) -> Any:
+    if p.suffix == ".ubj":
+        booster = xgb.Booster()
+        booster.load_model(str(p))
+        return booster
+    return joblib.load(p)
+
+
 def load_models(
     model_dir: Optional[Path],
     logger: Optional[logging.Logger] = None,
@@ -116,6 +369,10 @@ def load_models(
     """
     Load all ``.pkl`` and ``.joblib`` models from *model_dir*.
 
+    If a ``.ubj`` file with the same stem exists (see
+    :func:`export_native_models`) and is not older than the pickle, it is
+    loaded as an ``xgboost.Booster`` instead.
+
     Parameters
     ----------
     model_dir : Path or None
@@ -125,7 +382,8 @@ def load_models(
 
     Returns
     -------
-    Dict mapping clean model name → fitted model object.
+    Dict mapping clean model name → fitted model object (or a FIL model /
+    compiled ``tl2cgen.Predictor`` when GPU or Treelite scoring is enabled).
     """
     _log = logger or logging.getLogger(__name__)
     models: Dict[str, Any] = {}
@@ -134,13 +392,31 @@ def load_models(
         _log.warning("Model directory missing or not provided: %s", model_dir)
         return models
 
+    use_fil = USE_FIL and _HAS_FIL
+    if USE_FIL and not _HAS_FIL:
+        _log.warning("TREECRISPR_USE_FIL is set but cuml/cupy are not installed.")
+
+    compile_models = USE_TREELITE and _HAS_TREELITE and not use_fil
+    if USE_TREELITE and not _HAS_TREELITE:
+        _log.warning("TREECRISPR_TREELITE is set but treelite/tl2cgen are not installed.")
+
     model_dir = Path(model_dir)
-    paths = sorted(model_dir.glob("*.pkl")) + sorted(model_dir.glob("*.joblib"))
 
-    for p in paths:
+    for p, sibling in _model_files(model_dir):
+        if sibling is not None and sibling.suffix == ".ubj":
+            _log.warning(
+                "%s is older than %s; loading the pickle (re-run export_native_models).",
+                sibling.name, p.name,
+            )
         try:
-            model = joblib.load(p)
+            model = _load_one(p)
+            if use_fil and (_is_xgb_sklearn(model) or _is_xgb_booster(model)):
+                model = _load_fil(model, p, _log)
+            elif compile_models and (_is_xgb_sklearn(model) or _is_xgb_booster(model)):
+                model = _compile_treelite(model, p, _log)
             name = pretty_model_name(p.stem)
+            if _needs_call_mode(model):
+                _set_call_mode(model, _probe_call_mode(model, _FEATURE_COLUMNS, name, _log))
             models[name] = model
             _log.info("Loaded model: %s", name)
         except Exception as exc:
@@ -150,14 +426,89 @@ def load_models(
     return models
 
 
+@functools.lru_cache(maxsize=4)
+def _cached_load(
+    model_dir: Path,
+    signature: Tuple[Tuple[str, float, Optional[float]], ...],
+    logger: Optional[logging.Logger],
+) -> Dict[str, Any]:
+    return load_models(model_dir, logger=logger)
+
+
+def load_models_cached(
+    model_dir: Optional[Path],
+    logger: Optional[logging.Logger] = None,
+) -> Dict[str, Any]:
+    """
+    Like :func:`load_models`, but keep the result in memory.
+
+    The cache is keyed by the resolved directory and the name and mtime of
+    every model file in it (both files when a pickle has a ``.ubj``
+    sibling), so adding, replacing or removing a model triggers a reload.
+    Up to four directories are kept.
+    """
+    if not model_dir or not Path(model_dir).exists():
+        return load_models(model_dir, logger=logger)
+
+    model_dir = Path(model_dir).resolve()
+    signature = tuple(
+        (p.name, p.stat().st_mtime, sibling.stat().st_mtime if sibling else None)
+        for p, sibling in _model_files(model_dir)
+    )
+    # Shallow copy so callers cannot alter the cached mapping.
+    return dict(_cached_load(model_dir, signature, logger))
+
+
+def export_native_models(
+    model_dir: Path,
+    logger: Optional[logging.Logger] = None,
+) -> List[Path]:
+    """
+    Save every pickled XGBoost model in *model_dir* in XGBoost's native
+    binary format (``{stem}.ubj``, next to the pickle).
+
+    One-off migration: afterwards :func:`load_models` picks up the ``.ubj``
+    files instead of unpickling, as long as they are not older than the
+    pickle (re-run after retraining).  Non-XGBoost models are left as they
+    are.  A scikit-learn wrapper's ``missing`` value is stored as the
+    booster attribute ``missing`` so the bare booster scores the same way.
+
+    Returns
+    -------
+    List of ``.ubj`` paths written.
+    """
+    _log = logger or logging.getLogger(__name__)
+    written: List[Path] = []
+    if not _HAS_XGBOOST:
+        _log.warning("xgboost is not installed; nothing to export.")
+        return written
+
+    model_dir = Path(model_dir)
+    for p in sorted(model_dir.glob("*.pkl")) + sorted(model_dir.glob("*.joblib")):
+        try:
+            model = joblib.load(p)
+            if not (_is_xgb_sklearn(model) or _is_xgb_booster(model)):
+                continue
+            out = p.with_suffix(".ubj")
+            booster = _as_booster(model).copy()
+            booster.set_attr(missing=str(_missing_value(model)))
+            booster.save_model(str(out))
+            written.append(out)
+            _log.info("Exported %s → %s", p.name, out.name)
+        except Exception as exc:
+            _log.error("Failed to export '%s': %s", p.name, exc)
+
+    return written
+
+
 # ---------------------------------------------------------------------------
 # Prediction engine
 # ---------------------------------------------------------------------------
 
 def _predict_safe(
     model: Any,
-    X: pd.DataFrame,
-    strip_names: bool = False,
+    data: Any,
+    **kwargs: Any,
 ) -> np.ndarray:
     """
     Run ``predict_proba`` (classifiers) or ``predict`` (regressors) safely.
@@ -165,29 +516,179 @@ def _predict_safe(
     Parameters
     ----------
     model : fitted sklearn-compatible model
-    X : pd.DataFrame
-        Feature matrix (only numeric columns are used).
-    strip_names : bool
-        If ``True``, convert *X* to a raw NumPy array so XGBoost cannot
-        perform a feature-name validation check.
+    data : pd.DataFrame or np.ndarray
+        Numeric feature matrix.  Pass a NumPy array to bypass feature-name
+        validation.
+    **kwargs
+        Extra keyword arguments forwarded to the predict call
+        (e.g. ``validate_features=False`` for XGBoost).
 
     Returns
     -------
     1-D NumPy array of predicted scores.
     """
-    X_clean = X.select_dtypes(include=[np.number])
-    data = X_clean.values if strip_names else X_clean
-
     if hasattr(model, "predict_proba"):
         try:
-            proba = model.predict_proba(data)
+            proba = model.predict_proba(data, **kwargs)
             if proba.ndim == 2 and proba.shape[1] == 2:
                 return proba[:, 1]
             return proba.max(axis=1)
         except AttributeError:
             pass  # fall through to predict()
 
-    return model.predict(data)
+    return model.predict(data, **kwargs)
+
+
+def _predict_booster(booster: Any, X: np.ndarray, missing: float = np.nan) -> np.ndarray:
+    """
+    Score *X* in place with an ``xgboost.Booster``, matching
+    :func:`_predict_safe` output.
+
+    Like the scikit-learn wrapper, only trees up to ``best_iteration`` are
+    used when the model was trained with early stopping, and *missing* is
+    the value treated as missing (see :func:`_missing_value`).
+    """
+    best = booster.attr("best_iteration")
+    iteration_range = (0, int(best) + 1) if best is not None else (0, 0)
+    out = booster.inplace_predict(
+        X, iteration_range=iteration_range, missing=missing, validate_features=False
+    )
+    if out.ndim == 2 and out.shape[1] == 2:
+        return out[:, 1]
+    if out.ndim == 2:
+        return out.max(axis=1)
+    return out
+
+
+_UNPROBED = object()
+
+
+def _get_call_mode(model: Any) -> Any:
+    """Return the cached calling convention of *model*, or ``_UNPROBED``."""
+    try:
+        with _NAME_MODE_LOCK:
+            return _NAME_MODE.get(model, _UNPROBED)
+    except TypeError:  # not weak-referenceable / hashable
+        return _UNPROBED
+
+
+def _set_call_mode(model: Any, mode: Any) -> None:
+    """Cache (or, with ``_UNPROBED``, forget) the calling convention of *model*."""
+    try:
+        with _NAME_MODE_LOCK:
+            if mode is _UNPROBED:
+                _NAME_MODE.pop(model, None)
+            else:
+                _NAME_MODE[model] = mode
+    except TypeError:  # not weak-referenceable / hashable: probe every call
+        pass
+
+
+def _needs_call_mode(model: Any) -> bool:
+    """Return ``True`` if *model* is scored through a calling convention."""
+    if isinstance(model, _FILModel):
+        return False
+    if _HAS_TREELITE and isinstance(model, tl2cgen.Predictor):
+        return False
+    return not (_is_xgb_booster(model) or _is_xgb_sklearn(model))
+
+
+def _probe_call_mode(
+    model: Any,
+    columns: List[str],
+    name: str,
+    log: logging.Logger,
+) -> Optional[str]:
+    """
+    Return the calling convention *model* accepts for features *columns*.
+
+    Tries "direct", "renamed" and "stripped" in turn on a single all-zero
+    row.  Returns ``None`` (and logs why) if the model fails on anything
+    other than a feature mismatch, or if all three conventions fail.
+    """
+    X_probe = np.zeros((1, len(columns)), dtype=np.float32)
+    direct = pd.DataFrame(X_probe, columns=columns)
+
+    # Attempt 1: standard prediction.
+    try:
+        _predict_safe(model, direct)
+        return "direct"
+    except Exception as exc:
+        # Keep the exception: the "except ... as" name is cleared on exit.
+        exc1 = exc
+        err = str(exc).lower()
+
+    if not ("feature" in err or "data did not have" in err or "mismatch" in err):
+        log.error("[SKIP] %s crashed unexpectedly: %s", name, exc1)
+        return None
+
+    # Attempt 2: rename columns to R naming convention.
+    try:
+        log.info("[%s] Column name mismatch — using renamed columns.", name)
+        _predict_safe(model, fix_column_names_for_xgboost(direct))
+        return "renamed"
+    except Exception:
+        pass
+
+    # Attempt 3: strip column names entirely.
+    try:
+        log.warning("[%s] Renaming failed — passing raw numpy array.", name)
+        _predict_safe(model, X_probe)
+        return "stripped"
+    except Exception as exc3:
+        log.error("[SKIP] %s failed all 3 scoring attempts: %s", name, exc3)
+        return None
+
+
+def _score_one(
+    name: str,
+    model: Any,
+    X_np: np.ndarray,
+    input_for: Callable[[str], Any],
+    log: logging.Logger,
+) -> Any:
+    """
+    Score one model and return its predictions (``np.nan`` on failure).
+
+    *input_for* maps a calling convention ("direct", "renamed", "stripped")
+    to the matching shared input matrix; "device" gives the shared matrix
+    copied to the GPU for FIL models.
+    """
+    if isinstance(model, _FILModel):
+        try:
+            return _predict_fil(model, input_for("device"))
+        except Exception as exc:
+            log.error("[SKIP] %s crashed unexpectedly: %s", name, exc)
+            return np.nan
+
+    if _HAS_TREELITE and isinstance(model, tl2cgen.Predictor):
+        try:
+            return _predict_treelite(model, X_np)
+        except Exception as exc:
+            log.error("[SKIP] %s crashed unexpectedly: %s", name, exc)
+            return np.nan
+
+    if _is_xgb_booster(model) or _is_xgb_sklearn(model):
+        try:
+            return _predict_booster(_as_booster(model), X_np, missing=_missing_value(model))
+        except Exception as exc:
+            log.error("[SKIP] %s crashed unexpectedly: %s", name, exc)
+            return np.nan
+
+    mode = _get_call_mode(model)
+    if mode is _UNPROBED:
+        mode = _probe_call_mode(model, list(input_for("direct").columns), name, log)
+        _set_call_mode(model, mode)
+    if mode is None:
+        return np.nan
+
+    try:
+        return _predict_safe(model, input_for(mode))
+    except Exception as exc:
+        # Forget the convention so the next call probes again.
+        _set_call_mode(model, _UNPROBED)
+        log.error("[SKIP] %s crashed unexpectedly: %s", name, exc)
+        return np.nan
 
 
 def score_with_models(
@@ -199,13 +700,22 @@ def score_with_models(
     """
     Score *features_df* with every model in *models*.
 
-    Uses a three-attempt fallback strategy for robustness against column-name
-    mismatches between Python-generated features and R-trained models:
+    Models are scored concurrently on a thread pool (XGBoost and compiled
+    Treelite predictors release the GIL while predicting).  FIL (GPU) models,
+    Treelite-compiled predictors and XGBoost models are scored directly on a
+    shared ``float32`` array (XGBoost via ``inplace_predict``, without
+    building a ``DMatrix``).
+    Other models are called with one of three conventions, for robustness
+    against column-name mismatches between Python-generated features and
+    R-trained models:
 
     1. Standard prediction with original column names.
     2. Column renaming (``pos0_A`` → ``A1``, etc.).
     3. Strip column names entirely and pass raw NumPy arrays.
 
+    The convention is chosen once per model by probing with a single
+    all-zero row (see :func:`load_models`), so scoring never retries.
+
     Parameters
     ----------
     features_df : pd.DataFrame
@@ -219,7 +729,7 @@ def score_with_models(
     Returns
     -------
     pd.DataFrame with one column per model, aligned to *features_df* by index.
-    Missing values (``NaN``) indicate that all three attempts failed.
+    Missing values (``NaN``) indicate that the model could not be scored.
     """
     _log = logger or logging.getLogger(__name__)
     results = pd.DataFrame(index=features_df.index)
@@ -227,36 +737,33 @@ def score_with_models(
     if features_df.empty or not models:
         return results
 
-    for name, model in models.items():
-        # Attempt 1: standard prediction.
-        try:
-            results[name] = _predict_safe(model, features_df, strip_names=False)
-            continue
-        except Exception as exc1:
-            err = str(exc1).lower()
-
-        # Attempt 2: rename columns to R naming convention.
-        if "feature" in err or "data did not have" in err or "mismatch" in err:
-            df_fixed: Optional[pd.DataFrame] = None
-            try:
-                _log.info("[%s] Column name mismatch — renaming and retrying …", name)
-                df_fixed = fix_column_names_for_xgboost(features_df)
-                results[name] = _predict_safe(model, df_fixed, strip_names=False)
-                continue
-            except Exception:
-                pass
-
-            # Attempt 3: strip column names entirely.
-            try:
-                _log.warning("[%s] Renaming failed — passing raw numpy array …", name)
-                df_to_use = df_fixed if df_fixed is not None else features_df
-                results[name] = _predict_safe(model, df_to_use, strip_names=True)
-                continue
-            except Exception as exc3:
-                _log.error("[SKIP] %s failed all 3 scoring attempts: %s", name, exc3)
-                results[name] = np.nan
-        else:
-            _log.error("[SKIP] %s crashed unexpectedly: %s", name, exc1)
-            results[name] = np.nan
+    # Build every input representation at most once for all models.  For a
+    # frame from compute_features_only (a float32 C-ordered buffer wrapped
+    # without copying) X_np is that buffer itself; other frames are copied.
+    X_num = features_df.select_dtypes(include=[np.number])
+    X_np = np.ascontiguousarray(X_num.to_numpy(dtype=np.float32))
+    inputs: Dict[str, Any] = {"direct": X_num, "stripped": X_np}
+    inputs_lock = threading.Lock()
+
+    def _input_for(mode: str) -> Any:
+        with inputs_lock:
+            if mode not in inputs:
+                if mode == "device":
+                    # One host→device copy shared by every FIL model.
+                    inputs[mode] = cupy.asarray(X_np)
+                else:
+                    inputs[mode] = fix_column_names_for_xgboost(X_num)
+            return inputs[mode]
+
+    workers = min(len(models), os.cpu_count() or 1)
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        futures = {
+            name: ex.submit(_score_one, name, model, X_np, _input_for, _log)
+            for name, model in models.items()
+        }
+
+    # Assign in model order so the output column order is deterministic.
+    for name, fut in futures.items():
+        results[name] = fut.result()
 
     return results
@@ -13,39 +13,103 @@ Workflow
 4. **Output** — scored candidates are merged with their coordinates and
    returned as a single :class:`pandas.DataFrame`.
 
+:func:`iter_full_pipeline` runs the same steps on a stream of records and
+yields scored chunks of about ``chunk_size`` candidates, so arbitrarily
+large FASTA inputs can be processed in bounded memory (see
+:func:`~treecrispr.io_utils.iter_fasta_file`).
+
 Public API
 ----------
 build_candidates(fasta_id, seq)          → pd.DataFrame
-compute_features_only(df_base, logger)   → pd.DataFrame
+feature_buffer(n)                        → (out, seq_view, epi_view)
+compute_features_only(df_base, log, bigwigs, bigwig_lock) → pd.DataFrame
+iter_full_pipeline(records, log, model_dir, chunk_size) → Iterator[pd.DataFrame]
 run_full_pipeline(records, logger, model_dir) → pd.DataFrame
 """
 
 from __future__ import annotations
 
+import contextlib
 import logging
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Any, ContextManager, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 
 from .config import MAX_SEQ_LEN
-from .features_epi import epigenetic_features
-from .features_seq import reverse_complement, seq_features_for
-from .models import load_models, score_with_models
+from .epi_seq import close_bigwigs
+from .features_epi import EPI_FEATURE_NAMES, epigenetic_feature_matrix, open_bigwigs
+from .features_seq import SEQ_FEATURE_NAMES, reverse_complement, seq_feature_matrix
+from .models import load_models_cached, score_with_models
 from .scanner import scan_sequence
 
 logger = logging.getLogger(__name__)
 
 # Output columns present in every candidate row (before scores are appended).
-_CANDIDATE_COLS: list[str] = [
+CANDIDATE_COLS: list[str] = [
     "ID", "Start", "End", "Strand", "Sequence", "ReverseComplement", "PAM",
 ]
 
+# Fixed categories of the categorical ``Strand`` column.
+_STRANDS: List[str] = ["+", "-"]
+
+# Default number of candidates scored per chunk by iter_full_pipeline.
+_CHUNK_SIZE: int = 10_000
+
 
 # ---------------------------------------------------------------------------
 # Candidate builder
 # ---------------------------------------------------------------------------
 
+def _candidate_columns(fasta_id: str, seq: str) -> Dict[str, list]:
+    """
+    Scan *seq* and return its candidates as plain column lists keyed by
+    :data:`CANDIDATE_COLS` (see :func:`build_candidates`).
+    """
+    seq = seq.upper().replace("U", "T")
+    cols: Dict[str, list] = {c: [] for c in CANDIDATE_COLS}
+
+    # Reverse-complement the record once; the RC of seq[start:end] is then
+    # the slice rc_full[n - end:n - start].
+    n = len(seq)
+    rc_full = reverse_complement(seq)
+
+    for start, end, strand, pam_seq in scan_sequence(seq):
+        window = seq[start:end]
+        rc = rc_full[n - end:n - start]
+
+        if strand == "+":
+            # Forward hit: the 30-mer is already in NGG orientation.
+            final_seq, final_rc = window, rc
+        else:
+            # Reverse hit (CCN on forward strand): swap so 'Sequence' is NGG-oriented.
+            final_seq, final_rc = rc, window
+
+        cols["Start"].append(start)
+        cols["End"].append(end)
+        cols["Strand"].append(strand)
+        cols["Sequence"].append(final_seq)
+        cols["ReverseComplement"].append(final_rc)
+        cols["PAM"].append(pam_seq)
+
+    cols["ID"] = [fasta_id] * len(cols["Start"])
+    return cols
+
+
+def _candidates_frame(cols: Mapping[str, list]) -> pd.DataFrame:
+    """Build the candidate DataFrame from column lists with explicit dtypes."""
+    return pd.DataFrame({
+        "ID":               pd.Categorical(cols["ID"]),
+        "Start":            np.asarray(cols["Start"], dtype=np.int32),
+        "End":              np.asarray(cols["End"], dtype=np.int32),
+        "Strand":           pd.Categorical(cols["Strand"], categories=_STRANDS),
+        "Sequence":         pd.Series(cols["Sequence"], dtype=object),
+        "ReverseComplement": pd.Series(cols["ReverseComplement"], dtype=object),
+        "PAM":              pd.Categorical(cols["PAM"]),
+    }, columns=CANDIDATE_COLS)
+
+
 def build_candidates(fasta_id: str, seq: str) -> pd.DataFrame:
     """
     Return a DataFrame of guide-RNA candidates for a single FASTA record.
@@ -56,6 +120,9 @@ def build_candidates(fasta_id: str, seq: str) -> pd.DataFrame:
     - The ``ReverseComplement`` column shows the opposite-strand sequence.
     - ``PAM`` is the exact 3-nt PAM in NGG form (e.g. ``"AGG"``, ``"TGG"``).
 
+    ``Start`` / ``End`` are ``int32``; ``ID``, ``Strand`` and ``PAM`` are
+    categorical.
+
     Parameters
     ----------
     fasta_id : str
@@ -65,48 +132,43 @@ def build_candidates(fasta_id: str, seq: str) -> pd.DataFrame:
 
     Returns
     -------
-    pd.DataFrame with columns :data:`_CANDIDATE_COLS`.
+    pd.DataFrame with columns :data:`CANDIDATE_COLS`.
     """
-    seq = seq.upper().replace("U", "T")
-    rows: list[dict] = []
-
-    for start, end, strand, pam_seq in scan_sequence(seq):
-        window = seq[start:end]
-        rc = reverse_complement(window)
-
-        if strand == "+":
-            # Forward hit: the 30-mer is already in NGG orientation.
-            final_seq, final_rc = window, rc
-        else:
-            # Reverse hit (CCN on forward strand): swap so 'Sequence' is NGG-oriented.
-            final_seq, final_rc = rc, window
-
-        rows.append({
-            "ID":               fasta_id,
-            "Start":            start,
-            "End":              end,
-            "Strand":           strand,
-            "Sequence":         final_seq,
-            "ReverseComplement": final_rc,
-            "PAM":              pam_seq,
-        })
-
-    return pd.DataFrame(rows, columns=_CANDIDATE_COLS)
+    return _candidates_frame(_candidate_columns(fasta_id, seq))
 
 
 # ---------------------------------------------------------------------------
 # Feature extraction
 # ---------------------------------------------------------------------------
 
+def feature_buffer(n: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Allocate the ``(n, F_seq + F_epi)`` feature matrix for *n* candidates.
+
+    Returns the matrix and its sequence / epigenetic column views, which the
+    feature functions fill in place via their ``out`` argument.  The matrix
+    is ``float32``, the precision XGBoost predicts in, so scoring can use it
+    without a conversion copy.
+    """
+    n_seq = len(SEQ_FEATURE_NAMES)
+    out = np.empty((n, n_seq + len(EPI_FEATURE_NAMES)), dtype=np.float32)
+    return out, out[:, :n_seq], out[:, n_seq:]
+
+
 def compute_features_only(
     df_base: pd.DataFrame,
     log: Optional[logging.Logger] = None,
+    bigwigs: Optional[Mapping[str, Any]] = None,
+    bigwig_lock: Optional[ContextManager[Any]] = None,
 ) -> pd.DataFrame:
     """
     Compute sequence and epigenetic features for all rows in *df_base*.
 
     The ``Sequence`` column is already NGG-oriented, so features are always
     extracted with ``strand="+"`` (no additional reverse-complement step).
+    Both feature blocks are built column-wise for the whole frame and written
+    straight into one preallocated matrix (see :func:`feature_buffer`), which
+    the returned DataFrame wraps without copying.
 
     Parameters
     ----------
@@ -114,32 +176,144 @@ def compute_features_only(
         Candidate DataFrame produced by :func:`build_candidates`.
     log : logging.Logger, optional
         Logger for epigenetic feature warnings.
+    bigwigs : dict, optional
+        Open BigWig handles from
+        :func:`~treecrispr.features_epi.open_bigwigs`, shared across calls.
+        If omitted, the tracks are opened for this call only.
+    bigwig_lock : context manager, optional
+        Held around the epigenetic step only, e.g. a :class:`threading.Lock`
+        when *bigwigs* are shared between threads (pyBigWig handles are not
+        thread-safe).  The sequence step runs outside it.
 
     Returns
     -------
-    pd.DataFrame of numeric features, aligned to *df_base* by index.
-    NaN values are filled with 0.0.
+    pd.DataFrame of ``float32`` features, aligned to *df_base* by index and
+    backed by the :func:`feature_buffer` matrix (no copy).  NaN values are
+    filled with 0.0.
     """
     if df_base.empty:
         return pd.DataFrame(index=df_base.index)
 
-    feat_rows: List[Dict[str, float]] = []
-    for _, row in df_base.iterrows():
-        # Sequence is always NGG-oriented; pass strand="+" directly.
-        fseq = seq_features_for(row["Sequence"], "+")
-        fepi = epigenetic_features(row, logger=log)
-        fseq.update(fepi)
-        feat_rows.append(fseq)
-
-    return pd.DataFrame(feat_rows).fillna(0.0)
+    out, seq_out, epi_out = feature_buffer(len(df_base))
+    seq_feature_matrix(df_base["Sequence"].tolist(), out=seq_out)
+    with bigwig_lock if bigwig_lock is not None else contextlib.nullcontext():
+        epigenetic_feature_matrix(df_base, logger=log, bigwigs=bigwigs, out=epi_out)
+
+    # Fill NaN (e.g. a failed RNAfold energy) in place and wrap the buffer
+    # without copying, so score_with_models hands this same C-contiguous
+    # matrix to the models.
+    np.nan_to_num(out, copy=False, nan=0.0, posinf=np.inf, neginf=-np.inf)
+    return pd.DataFrame(
+        out,
+        columns=SEQ_FEATURE_NAMES + EPI_FEATURE_NAMES,
+        index=df_base.index,
+        copy=False,
+    )
 
 
 # ---------------------------------------------------------------------------
 # Full pipeline
 # ---------------------------------------------------------------------------
 
+def _score_candidates(
+    df: pd.DataFrame,
+    models: Dict[str, Any],
+    bigwigs: Mapping[str, Any],
+    model_dir: Optional[Path],
+    log: logging.Logger,
+) -> pd.DataFrame:
+    """Compute features for *df*, score them, and append the score columns."""
+    # ------------------------------------------------------------------
+    # Step 2: compute features
+    # ------------------------------------------------------------------
+    log.info("Computing features for %d candidates …", len(df))
+    F = compute_features_only(df, log=log, bigwigs=bigwigs)
+    log.debug("Feature matrix shape: %s", F.shape)
+
+    # ------------------------------------------------------------------
+    # Step 3: score with XGBoost models
+    # ------------------------------------------------------------------
+    if models and not F.empty:
+        scores = score_with_models(F, models, model_dir=model_dir, logger=log)
+    else:
+        scores = pd.DataFrame(index=F.index)
+
+    # ------------------------------------------------------------------
+    # Step 4: merge coordinates + scores
+    # ------------------------------------------------------------------
+    return pd.concat(
+        [df.reset_index(drop=True), scores.reset_index(drop=True)],
+        axis=1,
+    )
+
+
+def iter_full_pipeline(
+    records: Iterable[Tuple[str, str]],
+    log: Optional[logging.Logger] = None,
+    model_dir: Optional[Path] = None,
+    chunk_size: Optional[int] = _CHUNK_SIZE,
+) -> Iterator[pd.DataFrame]:
+    """
+    Run the pipeline over a stream of records, yielding scored chunks.
+
+    Candidates are accumulated record by record; once at least *chunk_size*
+    are pending they are featurised, scored and yielded, so only one chunk
+    is held in memory at a time.  Models are loaded and BigWig files opened
+    once for the whole stream.
+
+    Parameters
+    ----------
+    records : iterable of (id, seq) tuples
+        FASTA records, e.g. from :func:`~treecrispr.io_utils.iter_fasta_file`.
+    log : logging.Logger, optional
+        Logger for progress and warning messages.
+    model_dir : Path, optional
+        Directory containing the model files (see :func:`run_full_pipeline`).
+    chunk_size : int or None
+        Minimum number of candidates per yielded chunk (a record's candidates
+        are never split).  ``None`` scores everything as a single chunk.
+
+    Yields
+    ------
+    pd.DataFrame chunks with the same columns as :func:`run_full_pipeline`.
+    Nothing is yielded if no candidates are found.
+    """
+    _log = log or logger
+    models = load_models_cached(model_dir, logger=_log) if model_dir else {}
+    bigwigs = open_bigwigs()
+
+    try:
+        # --------------------------------------------------------------
+        # Step 1: scan sequences for guide candidates
+        # --------------------------------------------------------------
+        # Candidates are accumulated as flat column lists and turned into a
+        # single DataFrame per chunk.
+        pending: Dict[str, list] = {c: [] for c in CANDIDATE_COLS}
+        n_pending = 0
+        for rid, seq in records:
+            if len(seq) > MAX_SEQ_LEN:
+                _log.warning("Skipping '%s': length %d exceeds MAX_SEQ_LEN=%d.", rid, len(seq), MAX_SEQ_LEN)
+                continue
+            cols = _candidate_columns(rid, seq)
+            if not cols["Start"]:
+                continue
+            for c in CANDIDATE_COLS:
+                pending[c].extend(cols[c])
+            n_pending += len(cols["Start"])
+
+            if chunk_size is not None and n_pending >= chunk_size:
+                df = _candidates_frame(pending)
+                pending, n_pending = {c: [] for c in CANDIDATE_COLS}, 0
+                yield _score_candidates(df, models, bigwigs, model_dir, _log)
+
+        if n_pending:
+            yield _score_candidates(_candidates_frame(pending), models, bigwigs, model_dir, _log)
+    finally:
+        close_bigwigs(bigwigs)
+
+
 def run_full_pipeline(
-    records: List[Tuple[str, str]],
+    records: Iterable[Tuple[str, str]],
     log: Optional[logging.Logger] = None,
     model_dir: Optional[Path] = None,
 ) -> pd.DataFrame:
@@ -148,7 +322,7 @@ def run_full_pipeline(
 
     Parameters
     ----------
-    records : list of (id, seq) tuples
+    records : iterable of (id, seq) tuples
         Parsed FASTA records.  Sequences exceeding
         :data:`~treecrispr.config.MAX_SEQ_LEN` are skipped.
     log : logging.Logger, optional
@@ -161,48 +335,10 @@ def run_full_pipeline(
     Returns
     -------
     pd.DataFrame with candidate columns followed by one score column per
-    loaded model.  Returns an empty DataFrame with :data:`_CANDIDATE_COLS`
+    loaded model.  Returns an empty DataFrame with :data:`CANDIDATE_COLS`
     if no candidates are found.
     """
-    _log = log or logger
-
-    # ------------------------------------------------------------------
-    # Step 1: scan sequences for guide candidates
-    # ------------------------------------------------------------------
-    all_frames: List[pd.DataFrame] = []
-    for rid, seq in records:
-        if len(seq) > MAX_SEQ_LEN:
-            _log.warning("Skipping '%s': length %d exceeds MAX_SEQ_LEN=%d.", rid, len(seq), MAX_SEQ_LEN)
-            continue
-        cands = build_candidates(rid, seq)
-        if not cands.empty:
-            all_frames.append(cands)
-
-    if not all_frames:
-        return pd.DataFrame(columns=_CANDIDATE_COLS)
-
-    df = pd.concat(all_frames, ignore_index=True)
-
-    # ------------------------------------------------------------------
-    # Step 2: compute features
-    # ------------------------------------------------------------------
-    _log.info("Computing features for %d candidates …", len(df))
-    F = compute_features_only(df, log=_log)
-    _log.debug("Feature matrix shape: %s", F.shape)
-
-    # ------------------------------------------------------------------
-    # Step 3: score with XGBoost models
-    # ------------------------------------------------------------------
-    models = load_models(model_dir, logger=_log) if model_dir else {}
-    if models and not F.empty:
-        scores = score_with_models(F, models, model_dir=model_dir, logger=_log)
-    else:
-        scores = pd.DataFrame(index=F.index)
-
-    # ------------------------------------------------------------------
-    # Step 4: merge coordinates + scores
-    # ------------------------------------------------------------------
-    return pd.concat(
-        [df.reset_index(drop=True), scores.reset_index(drop=True)],
-        axis=1,
-    )
+    chunks = list(iter_full_pipeline(records, log=log, model_dir=model_dir, chunk_size=None))
+    if not chunks:
+        return pd.DataFrame(columns=CANDIDATE_COLS)
+    return chunks[0]
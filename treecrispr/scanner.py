@@ -20,6 +20,16 @@ For each window:
   - Reverse strand (CCN PAM):  positions [3:6]  must match CC[ATGC] on the
     forward strand, representing an NGG PAM on the complementary strand.
 
+The scan runs on a ``uint8`` view of the sequence.  If Numba is installed,
+a JIT-compiled single-pass kernel (:func:`_scan_kernel`) walks the bytes in
+native code; otherwise the window test is evaluated for every start position
+at once with NumPy (each PAM base becomes a shifted slice of the byte array
+and hits are pulled out with :func:`numpy.flatnonzero`).  Both produce the
+same hits in the same order.  Before either runs, ``bytes.find`` /
+``bytes.rfind`` locate the first and last ``GG`` / ``CC`` that can form a
+PAM (:func:`_pam_span`); records without one return immediately and the scan
+is limited to the span between them.
+
 The exact PAM trinucleotide (e.g. "AGG") is returned in NGG orientation for
 both strands.  Ambiguity codes are rejected — only A/T/G/C are accepted at
 the N position.
@@ -27,17 +37,127 @@ the N position.
 
 from __future__ import annotations
 
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
 
-_COMP: dict[int, str] = str.maketrans("ATGCatgc", "TACGtacg")
+_WINDOW: int = 30
 
+# Byte lookup tables (indexed by ASCII code).
 # Valid bases for the 'N' in NGG — strict mode rejects IUPAC ambiguity codes.
-_STRICT_BASES: frozenset[str] = frozenset("ATGC")
+_VALID_BYTE: np.ndarray = np.zeros(256, dtype=bool)
+_VALID_BYTE[np.frombuffer(b"ATGC", dtype=np.uint8)] = True
+
+_COMP_BYTE: np.ndarray = np.arange(256, dtype=np.uint8)
+_COMP_BYTE[np.frombuffer(b"ATGCatgc", dtype=np.uint8)] = np.frombuffer(b"TACGtacg", dtype=np.uint8)
+
+# Window offsets of the PAM bases.  The reverse-strand offsets are listed
+# back-to-front so that gathering through _COMP_BYTE yields the reverse
+# complement directly.
+_FWD_PAM_OFFSETS: np.ndarray = np.array([24, 25, 26])
+_REV_PAM_OFFSETS: np.ndarray = np.array([5, 4, 3])
+
+_G: int = ord("G")
+_C: int = ord("C")
+
+
+def _scan_kernel(
+    b: np.ndarray,
+    valid: np.ndarray,
+    comp: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Single-pass PAM scan over the byte array *b*.
+
+    Returns ``(starts, is_rev, pams)``: window starts in ascending order
+    (forward hit first for a shared start), a ``uint8`` strand flag, and an
+    ``(k, 3)`` ``uint8`` array of PAM bytes in NGG orientation.  Written as
+    a plain loop so that Numba can compile it; see :data:`_scan_jit`.
+    """
+    L = b.shape[0] - 30 + 1
+    starts = np.empty(2 * L, dtype=np.int64)
+    is_rev = np.empty(2 * L, dtype=np.uint8)
+    pams = np.empty((2 * L, 3), dtype=np.uint8)
+    k = 0
+    for i in range(L):
+        if b[i + 25] == 71 and b[i + 26] == 71 and valid[b[i + 24]]:      # [ATGC]GG
+            starts[k] = i
+            is_rev[k] = 0
+            pams[k, 0] = b[i + 24]
+            pams[k, 1] = b[i + 25]
+            pams[k, 2] = b[i + 26]
+            k += 1
+        if b[i + 3] == 67 and b[i + 4] == 67 and valid[b[i + 5]]:         # CC[ATGC]
+            starts[k] = i
+            is_rev[k] = 1
+            pams[k, 0] = comp[b[i + 5]]
+            pams[k, 1] = comp[b[i + 4]]
+            pams[k, 2] = comp[b[i + 3]]
+            k += 1
+    return starts[:k], is_rev[:k], pams[:k]
+
+
+try:
+    from numba import njit
+    _scan_jit = njit(cache=True, boundscheck=False)(_scan_kernel)
+    _HAS_NUMBA = True
+except ImportError:
+    _HAS_NUMBA = False
+
+
+def _scan_numpy(b: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Vectorised equivalent of :func:`_scan_kernel` (used without Numba)."""
+    L = b.shape[0] - _WINDOW + 1
+
+    # Forward strand: the 30-mer convention places the PAM at positions 24–26.
+    fwd = (b[25 : 25 + L] == _G) & (b[26 : 26 + L] == _G) & _VALID_BYTE[b[24 : 24 + L]]
+    # Reverse strand: CCN appears at positions 3–5 on the forward 30-mer.
+    rev = (b[3 : 3 + L] == _C) & (b[4 : 4 + L] == _C) & _VALID_BYTE[b[5 : 5 + L]]
+
+    fwd_starts = np.flatnonzero(fwd)
+    rev_starts = np.flatnonzero(rev)
+
+    starts = np.concatenate([fwd_starts, rev_starts])
+    is_rev = np.concatenate([np.zeros(len(fwd_starts), np.uint8), np.ones(len(rev_starts), np.uint8)])
+    pams = np.concatenate([
+        b[fwd_starts[:, None] + _FWD_PAM_OFFSETS],
+        _COMP_BYTE[b[rev_starts[:, None] + _REV_PAM_OFFSETS]],
+    ])
+
+    # Stable sort by start keeps "+" ahead of "-" for the same window.
+    order = np.argsort(starts, kind="stable")
+    return starts[order], is_rev[order], pams[order]
+
+
+def _pam_span(raw: bytes) -> Optional[Tuple[int, int]]:
+    """
+    Return the first and last window start that could hold a PAM, or
+    ``None`` if there is none.
+
+    Uses ``bytes.find`` / ``bytes.rfind`` (C-speed substring search) to
+    locate the outermost ``GG`` at window offset 25 and ``CC`` at offset 3,
+    so the detailed scan only covers that span.  The N of the PAM is still
+    validated by the scan itself.
+    """
+    n = len(raw)
+    firsts: List[int] = []
+    lasts: List[int] = []
 
+    # Forward: GG at offset 25–26 of a window starting in [0, n - 30].
+    g = raw.find(b"GG", 25, n - 3)
+    if g != -1:
+        firsts.append(g - 25)
+        lasts.append(raw.rfind(b"GG", 25, n - 3) - 25)
 
-def _reverse_complement(seq: str) -> str:
-    """Return the reverse complement of a DNA string (handles upper and lower case)."""
-    return seq.translate(_COMP)[::-1]
+    # Reverse: CC at offset 3–4 of a window starting in [0, n - 30].
+    c = raw.find(b"CC", 3, n - 25)
+    if c != -1:
+        firsts.append(c - 3)
+        lasts.append(raw.rfind(b"CC", 3, n - 25) - 3)
+
+    if not firsts:
+        return None
+    return min(firsts), max(lasts)
 
 
 def scan_sequence(seq: str) -> List[Tuple[int, int, str, str]]:
@@ -51,32 +171,36 @@ def scan_sequence(seq: str) -> List[Tuple[int, int, str, str]]:
 
     Returns
     -------
-    List of (start, end, strand, pam) tuples where:
+    List of (start, end, strand, pam) tuples, ordered by start with the
+    forward hit first when both strands match the same window, where:
         start  — 0-based start index of the 30-mer window in *seq*
         end    — exclusive end index (start + 30)
         strand — "+" for forward NGG hit, "-" for reverse CCN hit
         pam    — exact PAM trinucleotide in NGG orientation (e.g. "AGG", "TGG")
     """
     s = seq.upper().replace("U", "T")
-    n = len(s)
-    out: List[Tuple[int, int, str, str]] = []
-
-    for i in range(max(0, n - 30) + 1):
-        w = s[i : i + 30]
-        if len(w) < 30:
-            break
-
-        # Forward strand: guide is w[0:20], PAM is w[20:23] → but the 30-mer
-        # convention here places the PAM at positions 24–26 (0-based).
-        if w[25:27] == "GG" and w[24] in _STRICT_BASES:
-            out.append((i, i + 30, "+", w[24:27]))
-
-        # Reverse strand: CCN appears at positions 3–5 on the forward 30-mer.
-        if w[3:5] == "CC" and w[5] in _STRICT_BASES:
-            genomic_pam = w[3:6]
-            out.append((i, i + 30, "-", _reverse_complement(genomic_pam)))
-
-    return out
+    if len(s) < _WINDOW:
+        return []
+
+    # One byte per character; non-ASCII characters become "?" so indices
+    # still line up with *s*.
+    raw = s.encode("ascii", errors="replace")
+    span = _pam_span(raw)
+    if span is None:
+        return []
+    lo, hi = span
+    b = np.frombuffer(raw, dtype=np.uint8)[lo : hi + _WINDOW]
+
+    if _HAS_NUMBA:
+        starts, is_rev, pams = _scan_jit(b, _VALID_BYTE, _COMP_BYTE)
+    else:
+        starts, is_rev, pams = _scan_numpy(b)
+
+    pam_text = pams.tobytes().decode("ascii")
+    return [
+        (st + lo, st + lo + _WINDOW, "-" if rv else "+", pam_text[3 * k : 3 * k + 3])
+        for k, (st, rv) in enumerate(zip(starts.tolist(), is_rev.tolist()))
+    ]
 
 
 def scan_targets(record_id: str, seq: str) -> List[Dict]: